@@ -1,19 +1,20 @@
 from __future__ import annotations
+import asyncio
 import os
 import sys
-import json
-from typing import Any, Dict, List, Callable
+from typing import Any, Dict, List, Callable, Optional, Sequence
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 from dotenv import load_dotenv
-from openai import OpenAI, OpenAIError, RateLimitError
+from openai import AsyncOpenAI, OpenAIError, RateLimitError
+
+import fast_json
 
 # Tool function imports
-from retrievers.jira_retriever import fetch_jira_issues
+from retrievers.jira_retriever import JIRA_FIELDS, fetch_jira_issues
 from retrievers.roadmap_retriever import retrieve_roadmap_documents
 from retrievers.competitor_scraper import fetch_competitors
 
 from llm_modules.reasoning import generate_new_ideas
-from deduplication.checker import DeduplicationChecker
 from ideas.composer import IdeaComposer
 from output.export import IdeaExporter
 from feedback.collector import collect_ratings
@@ -30,6 +31,23 @@ def _tool_fetch_roadmap(params: Dict[str, Any]) -> List[Dict[str, Any]]:
     return docs
 
 
+def _jira_fields(requested: Any) -> Sequence[str]:
+    """
+    Return the known JIRA fields the model asked for, or all of them.
+
+    Accepts a list or a comma-separated string; unknown names are dropped.
+    """
+    if isinstance(requested, str):
+        requested = requested.split(",")
+    if not isinstance(requested, (list, tuple)):
+        return JIRA_FIELDS
+    fields = [
+        name.strip() for name in requested
+        if isinstance(name, str) and name.strip() in JIRA_FIELDS
+    ]
+    return list(dict.fromkeys(fields)) or JIRA_FIELDS
+
+
 def _tool_fetch_jira(params: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Fetch JIRA issues based on a JQL query.
@@ -38,7 +56,9 @@ def _tool_fetch_jira(params: Dict[str, Any]) -> List[Dict[str, Any]]:
     if not jql:
         raise ValueError("Parameter 'jql' is required")
     max_results = params.get("max_results", 50)
-    issues = fetch_jira_issues(jql=jql, max_results=max_results)
+    # only download the fields the model asked for (descriptions dominate page size)
+    fields = _jira_fields(params.get("fields"))
+    issues = fetch_jira_issues(jql=jql, max_results=max_results, fields=fields)
     return issues
 
 # Register additional tools as needed
@@ -49,69 +69,114 @@ TOOLS: Dict[str, Callable] = {
 }
 
 class AgentOrchestrator:
-    """Dynamic AI agent orchestrator using OpenAI function calling."""
+    """Dynamic AI agent orchestrator using OpenAI tool calling."""
 
     def __init__(self) -> None:
         load_dotenv()
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.dedup = DeduplicationChecker()
+        self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.composer = IdeaComposer()
         self.exporter = IdeaExporter()
+        self._tool_descriptions = self._build_tool_descriptions()
 
     def _build_tool_descriptions(self) -> List[Dict[str, Any]]:
         return [
             {
-                "name": "fetch_roadmap",
-                "description": "Fetch roadmap documents from a given URL.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "roadmap_url": {"type": "string", "description": "URL of the roadmap document"}
-                    },
-                    "required": ["roadmap_url"]
+                "type": "function",
+                "function": {
+                    "name": "fetch_roadmap",
+                    "description": "Fetch roadmap documents from a given URL.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "roadmap_url": {"type": "string", "description": "URL of the roadmap document"}
+                        },
+                        "required": ["roadmap_url"]
+                    }
                 }
             },
             {
-                "name": "fetch_jira",
-                "description": "Fetch Jira issues matching a JQL query.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "jql": {"type": "string", "description": "Jira Query Language string to filter issues"},
-                        "max_results": {"type": "integer", "description": "Maximum number of issues to fetch"}
-                    },
-                    "required": ["jql"]
+                "type": "function",
+                "function": {
+                    "name": "fetch_jira",
+                    "description": "Fetch Jira issues matching a JQL query.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "jql": {"type": "string", "description": "Jira Query Language string to filter issues"},
+                            "max_results": {"type": "integer", "description": "Maximum number of issues to fetch"},
+                            "fields": {
+                                "type": "array",
+                                "items": {"type": "string", "enum": list(JIRA_FIELDS)},
+                                "description": "Issue fields to fetch; omit descriptions when only titles or statuses are needed (default: all)"
+                            }
+                        },
+                        "required": ["jql"]
+                    }
                 }
             },
             {
-                "name": "fetch_competitors",
-                "description": "Fetch top competitors for a given product or domain via web-based GPT.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "product_name": {"type": "string", "description": "Name of the product or domain"},
-                        "max_results": {"type": "integer", "description": "Number of competitors to return"}
-                    },
-                    "required": ["product_name"]
+                "type": "function",
+                "function": {
+                    "name": "fetch_competitors",
+                    "description": "Fetch top competitors for a given product or domain via web-based GPT.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "product_name": {"type": "string", "description": "Name of the product or domain"},
+                            "max_results": {"type": "integer", "description": "Number of competitors to return"}
+                        },
+                        "required": ["product_name"]
+                    }
                 }
             }
         ]
 
-    @retry(stop=stop_after_attempt(4), wait=wait_random_exponential(min=1, max=10))
+    async def _call_tool(
+        self, name: str, args: Dict[str, Any], cache: Dict[str, asyncio.Future]
+    ) -> Any:
+        """Run a (blocking) tool in a worker thread so several can overlap.
+
+        Results are memoized in ``cache``, keyed on the tool name and its
+        canonicalized arguments, so repeated requests for the same data do not
+        hit the network again. A failed call is evicted so it can be retried.
+        """
+        key = name + fast_json.dumps(args, sort_keys=True)
+        if key not in cache:
+            cache[key] = asyncio.ensure_future(asyncio.to_thread(TOOLS[name], args))
+        try:
+            return await cache[key]
+        except Exception:
+            cache.pop(key, None)
+            raise
+
     def run(self, goal: str) -> None:
+        # one cache per run, shared by every retried attempt of arun
+        asyncio.run(self.arun(goal, {}))
+
+    @retry(stop=stop_after_attempt(4), wait=wait_random_exponential(min=1, max=10))
+    async def arun(
+        self, goal: str, tool_cache: Optional[Dict[str, asyncio.Future]] = None
+    ) -> None:
+        """Plan and execute tools until the model answers ``goal``.
+
+        Pass the same ``tool_cache`` dict to reuse finished tool results; when
+        omitted, each retried attempt starts with an empty cache.
+        """
         messages: List[Dict[str, Any]] = [
             {"role": "system", "content": "You are an AI agent that plans and executes tools to achieve a user goal."},
             {"role": "user", "content": goal},
         ]
+        if tool_cache is None:
+            tool_cache = {}
 
         # loop until done
         for _ in range(5):  # max steps
             try:
-                response = self.client.chat.completions.create(
-                    model=os.getenv("LLM_MODEL", "gpt-4o"),
+                response = await self.client.chat.completions.create(
+                    model=os.getenv("PLANNER_MODEL", "gpt-4o-mini"),
                     messages=messages,
-                    functions=self._build_tool_descriptions(),
-                    function_call="auto"
+                    tools=self._tool_descriptions,
+                    tool_choice="auto"
                 )
             except RateLimitError as e:
                 print("[ERROR] OpenAI RateLimitError:", e)
@@ -123,19 +188,30 @@ class AgentOrchestrator:
                 raise
 
             msg = response.choices[0].message
-            if msg.function_call:
-                name = msg.function_call.name
-                args = json.loads(msg.function_call.arguments)
-                result = TOOLS[name](args)
+            if msg.tool_calls:
+                # independent tool calls from one turn run concurrently
+                results = await asyncio.gather(*(
+                    self._call_tool(call.function.name, fast_json.loads(call.function.arguments), tool_cache)
+                    for call in msg.tool_calls
+                ))
                 messages.append({
                     "role": "assistant",
-                    "content": None,
-                    "function_call": {
-                        "name": name,
-                        "arguments": json.dumps(args)
-                    }
+                    "content": msg.content,
+                    "tool_calls": [
+                        {
+                            "id": call.id,
+                            "type": "function",
+                            "function": {
+                                "name": call.function.name,
+                                # already valid JSON, echo it back unchanged
+                                "arguments": call.function.arguments
+                            }
+                        }
+                        for call in msg.tool_calls
+                    ]
                 })
-                messages.append({"role": "function", "name": name, "content": json.dumps(result)})
+                for call, result in zip(msg.tool_calls, results):
+                    messages.append({"role": "tool", "tool_call_id": call.id, "content": fast_json.dumps(result)})
                 continue
             # final response
             print(msg.content)
@@ -1,19 +1,73 @@
 """Deduplication layer for idea checking."""
 
 
-import hashlib
-from typing import Dict, Set
+import logging
+import os
+import sys
+from array import array
+from typing import Dict, Optional, Set
+
+import xxhash
+
+logger = logging.getLogger(__name__)
 
 
 class DeduplicationChecker:
-    """Simple in-memory deduplication checker."""
+    """Simple in-memory deduplication checker.
+
+    When ``state_path`` is given, hashes seen in earlier runs are loaded from
+    that file; call :meth:`save` to write newly seen ones back, stored as
+    packed little-endian uint64 values (8 bytes per idea).
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, state_path: Optional[str] = None) -> None:
         """Initialize storage for seen idea hashes."""
-        self._seen_hashes: Set[str] = set()
+        self._seen_hashes: Set[int] = set()
+        self._state_path = state_path
+        self._loaded_count = 0
+        if state_path:
+            self._load()
+
+    def _load(self) -> None:
+        """Populate the seen set from ``state_path`` if the file exists."""
+
+        if not os.path.exists(self._state_path):
+            return
+        hashes = array("Q")
+        with open(self._state_path, "rb") as f:
+            data = f.read()
+        partial = len(data) % hashes.itemsize
+        if partial:
+            # e.g. an interrupted write; keep the complete hashes before it
+            logger.warning(
+                "Ignoring %d trailing bytes of truncated state file %s",
+                partial,
+                self._state_path,
+            )
+            data = data[:-partial]
+        hashes.frombytes(data)
+        if sys.byteorder != "little":
+            hashes.byteswap()
+        self._seen_hashes.update(hashes)
+        self._loaded_count = len(self._seen_hashes)
 
-    def _hash_title(self, idea: Dict | str) -> str:
-        """Return a stable hash for the given idea's title."""
+    def save(self) -> None:
+        """Write the seen hashes to ``state_path`` if new ones were added."""
+
+        if not self._state_path or len(self._seen_hashes) == self._loaded_count:
+            return
+        hashes = array("Q", self._seen_hashes)
+        if sys.byteorder != "little":
+            hashes.byteswap()
+        os.makedirs(os.path.dirname(self._state_path) or ".", exist_ok=True)
+        tmp_path = f"{self._state_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(hashes.tobytes())
+        os.replace(tmp_path, self._state_path)
+        self._loaded_count = len(self._seen_hashes)
+
+    def _hash_title(self, idea: Dict | str) -> int:
+        """Return a stable 64-bit hash for the given idea's title."""
 
         if isinstance(idea, dict):
             title = idea.get("title") or idea.get("summary") or str(idea)
@@ -21,7 +75,7 @@ class DeduplicationChecker:
             title = str(idea)
 
         normalized = title.strip().lower()
-        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        return xxhash.xxh3_64_intdigest(normalized.encode("utf-8"))
 
     def add(self, idea: Dict | str) -> None:
         """Add an idea to the seen set."""
@@ -32,3 +86,16 @@ class DeduplicationChecker:
         """Return ``True`` if the idea title has been seen before."""
 
         return self._hash_title(idea) in self._seen_hashes
+
+    def check_and_add(self, idea: Dict | str) -> bool:
+        """Return ``True`` if the idea was seen before, otherwise record it.
+
+        Equivalent to ``is_duplicate`` followed by ``add`` but hashes the title
+        only once.
+        """
+
+        idea_hash = self._hash_title(idea)
+        if idea_hash in self._seen_hashes:
+            return True
+        self._seen_hashes.add(idea_hash)
+        return False
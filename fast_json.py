@@ -0,0 +1,169 @@
+"""Thin JSON helpers backed by ``orjson``, then ``jiter``, then the stdlib."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the wheel
+    orjson = None
+
+try:
+    # Rust parser that ships as an ``openai`` dependency; used for decoding
+    # when the ``orjson`` wheel is unavailable on the platform.
+    import jiter
+except ImportError:  # pragma: no cover - exercised only without the wheel
+    jiter = None
+
+import json
+
+# ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError`` so callers can
+# catch a single exception type regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize ``data`` (``str`` or UTF-8 ``bytes``) to Python objects."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    if jiter is not None:
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        try:
+            return jiter.from_json(raw)
+        except ValueError as exc:
+            doc = data if isinstance(data, str) else data.decode("utf-8", "replace")
+            raise JSONDecodeError(str(exc), doc, 0) from exc
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string.
+
+    Non-ASCII characters are kept as-is and ``indent=True`` pretty-prints the
+    output with two spaces, matching ``json.dumps(..., ensure_ascii=False,
+    indent=2)``. ``sort_keys=True`` gives a canonical form usable as a key.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(
+        obj, ensure_ascii=False, indent=2 if indent else None, sort_keys=sort_keys
+    )
+
+
+_DECODER = json.JSONDecoder()
+# characters that can follow a complete array element
+_SCALAR_END = frozenset(" \t\r\n,]")
+
+
+class _ArrayFinder:
+    """Incremental scanner locating the target array in a growing buffer.
+
+    The target is a top-level array or the array value of ``key`` in the
+    top-level object (any key when ``key`` is ``None``). String contents are
+    skipped, so brackets inside values such as ``"see [1]"`` are ignored.
+    """
+
+    __slots__ = ("key", "pos", "depth", "in_string", "escaped", "string_start",
+                 "last_string", "current_key")
+
+    def __init__(self, key: str | None) -> None:
+        self.key = key
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.string_start = 0
+        self.last_string: str | None = None
+        self.current_key: str | None = None
+
+    def feed(self, buffer: str) -> int:
+        """Scan newly appended text; return the index after ``[`` or -1."""
+
+        pos = self.pos
+        end = len(buffer)
+        while pos < end:
+            char = buffer[pos]
+            pos += 1
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+                    if self.depth == 1:
+                        self.last_string = json.loads(buffer[self.string_start:pos])
+            elif char == '"':
+                self.in_string = True
+                self.string_start = pos - 1
+            elif char == "[":
+                if self.depth == 0 or (
+                    self.depth == 1
+                    and self.current_key is not None
+                    and self.key in (None, self.current_key)
+                ):
+                    self.pos = pos
+                    return pos
+                self.depth += 1
+            elif char == "{":
+                self.depth += 1
+            elif char in "]}":
+                self.depth -= 1
+            elif self.depth == 1:
+                if char == ":":
+                    self.current_key = self.last_string
+                elif char == ",":
+                    self.current_key = None
+        self.pos = pos
+        return -1
+
+
+def iter_array_items(chunks: Iterable[str], key: str | None = None) -> Iterator[Any]:
+    """Yield elements of a JSON array from a stream of text chunks.
+
+    The array is either the top-level value or the value of ``key`` in the
+    top-level object (the first array-valued key when ``key`` is ``None``).
+    Each element is yielded as soon as it is complete, so callers can start
+    processing before the whole document is received. Text outside the JSON
+    value (such as a Markdown fence) is skipped, and a number or other bare
+    scalar is only yielded once a delimiter (``,``, ``]`` or whitespace)
+    after it has arrived.
+    """
+
+    finder = _ArrayFinder(key)
+    buffer = ""
+    pos = -1
+    for chunk in chunks:
+        buffer += chunk
+        if pos < 0:
+            pos = finder.feed(buffer)
+            if pos < 0:
+                continue
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+            try:
+                item, end = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # element not complete yet, wait for the next chunk
+                break
+            if buffer[pos] not in '{["' and buffer[end:end + 1] not in _SCALAR_END:
+                # a bare scalar may continue in the next chunk ("1" -> "123",
+                # "0." -> "0.5", "1e" -> "1e3"); wait for a delimiter after it
+                break
+            pos = end
+            yield item
+        buffer = buffer[pos:]
+        pos = 0
@@ -1,27 +1,75 @@
 from __future__ import annotations
 
-import json
 import os
-from typing import List, Dict
+import re
+from typing import Dict, Iterator, List, Optional
 
+import fast_json
+
+
+# One or more 1-5 ratings separated by whitespace and/or commas
+_RATINGS_RE = re.compile(r"\s*[1-5](?:[\s,]+[1-5])*\s*")
+
+
+def _parse_ratings(text: str) -> Optional[List[int]]:
+    """Return the ratings in ``text``, ``[]`` if blank or ``None`` if invalid.
+
+    Any token other than 1-5 invalidates the whole text: dropping it would
+    shift the following ratings onto the wrong ideas.
+    """
+
+    if not text.strip():
+        return []
+    if _RATINGS_RE.fullmatch(text) is None:
+        return None
+    return [int(token) for token in text.replace(",", " ").split()]
 
-def collect_ratings(ideas: List[Dict]) -> None:
-    """Prompt the user to rate each idea and store the ratings."""
 
-    ratings = []
+def _prompt_ratings(ideas: List[Dict]) -> Iterator[int]:
+    """Yield one rating per idea, prompting only when none are pending."""
+
+    pending: List[int] = []
     for idea in ideas:
         title = idea.get("title", "Idea")
-        idea_id = idea.get("id")
-        while True:
+        while not pending:
             try:
-                value = int(input(f"Rate idea '{title}' (1-5): "))
-                if 1 <= value <= 5:
-                    break
-            except ValueError:
-                pass
-            print("Please enter a number between 1 and 5.")
-        ratings.append({"id": idea_id, "rating": value})
+                pending = _parse_ratings(input(f"Rate idea '{title}' (1-5): ")) or []
+            except EOFError:
+                # stdin is closed (non-interactive run) - stop asking
+                return
+            if not pending:
+                print("Please enter a number between 1 and 5.")
+        yield pending.pop(0)
+
+
+def collect_ratings(ideas: List[Dict]) -> None:
+    """Prompt the user to rate each idea and store the ratings.
+
+    Several ratings can be typed on one line (e.g. ``5 3 4``) and are applied
+    to the following ideas in order; a line with any value other than 1-5 is
+    rejected as a whole and asked again. If ``RATINGS_FILE`` is set, ratings
+    are read from that file instead of prompting and ``ValueError`` is raised
+    if it contains an invalid value; if stdin is closed, prompting stops and
+    only the ratings gathered so far are stored.
+    """
+
+    ratings_file = os.getenv("RATINGS_FILE")
+    if ratings_file:
+        with open(ratings_file, encoding="utf-8") as f:
+            parsed = _parse_ratings(f.read())
+        if parsed is None:
+            raise ValueError(
+                f"{ratings_file}: ratings must be numbers between 1 and 5"
+            )
+        values: Iterator[int] = iter(parsed)
+    else:
+        values = _prompt_ratings(ideas)
+
+    ratings = [
+        {"id": idea.get("id"), "rating": value}
+        for idea, value in zip(ideas, values)
+    ]
 
     os.makedirs("output", exist_ok=True)
     with open("output/feedback.json", "w", encoding="utf-8") as f:
-        json.dump(ratings, f, ensure_ascii=False, indent=2)
+        f.write(fast_json.dumps(ratings, indent=True))
@@ -3,9 +3,18 @@
 
 from __future__ import annotations
 
+import os
 import uuid
 from typing import Any, Dict, List
 
+_MARKDOWN_TEMPLATE = (
+    "* **{title}**\n"
+    "  * Problem: {problem}\n"
+    "  * Proposal: {proposal}\n"
+    "  * Business Value: {business_value}\n"
+    "  * Confidence: {confidence}"
+)
+
 
 class IdeaComposer:
     """Creates structured idea proposals."""
@@ -29,8 +38,10 @@ class IdeaComposer:
         """
 
         formatted: List[Dict[str, Any]] = []
+        # Draw the randomness for all ids with a single urandom call
+        entropy = os.urandom(16 * len(ideas))
 
-        for raw in ideas:
+        for index, raw in enumerate(ideas):
             if not isinstance(raw, dict):
                 # Skip invalid items but continue processing
                 continue
@@ -41,16 +52,16 @@ class IdeaComposer:
             business_value = raw.get("business_value", "")
             confidence = raw.get("confidence_score")
 
-            markdown = (
-                f"* **{title}**\n"
-                f"  * Problem: {problem}\n"
-                f"  * Proposal: {proposal}\n"
-                f"  * Business Value: {business_value}\n"
-                f"  * Confidence: {confidence}"
+            markdown = _MARKDOWN_TEMPLATE.format(
+                title=title,
+                problem=problem,
+                proposal=proposal,
+                business_value=business_value,
+                confidence=confidence,
             )
 
             structured = {
-                "id": str(uuid.uuid4()),
+                "id": str(uuid.UUID(bytes=entropy[index * 16:(index + 1) * 16], version=4)),
                 "title": title,
                 "markdown": markdown,
                 "metadata": {
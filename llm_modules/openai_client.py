@@ -0,0 +1,19 @@
+"""Process-wide OpenAI client shared by the retrievers and reasoning module."""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+from openai import OpenAI
+
+
+@lru_cache(maxsize=None)
+def get_client() -> OpenAI:
+    """Return the shared synchronous OpenAI client.
+
+    The client is created lazily on first use, after ``.env`` has been loaded,
+    and reused afterwards so every caller shares one HTTP connection pool
+    instead of paying a fresh TLS handshake per module.
+    """
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
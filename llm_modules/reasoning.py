@@ -1,18 +1,72 @@
 from __future__ import annotations
 
-import json
 import os
-from typing import Dict, List, Any
+import time
+from typing import Dict, Iterator, List, Any, Optional
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 from openai import OpenAI
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+from typing_extensions import TypedDict
+
+import fast_json
+from llm_modules.openai_client import get_client
+
+# Batch statuses after which no further progress will be made
+_BATCH_FINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+# JSON mode: the model is constrained to emit a single valid JSON object
+_RESPONSE_FORMAT = {"type": "json_object"}
+
+_SYSTEM_PROMPT = (
+    "You are an expert product manager and consultant. Generate strategic, novel product roadmap ideas."
+)
+# Filled with str.format in one allocation; braces in the inserted text are kept
+_USER_PROMPT_TEMPLATE = (
+    "Project Documentation:\n{docs}"
+    "\n\nExisting Jira Issues:\n{issues}"
+    "\n\nPlease propose 2-5 new, non-overlapping roadmap ideas. Respond with a JSON"
+    " object whose \"ideas\" key holds an array of ideas."
+    " Each idea should be an object with keys:\n"
+    "  - title: concise idea name\n"
+    "  - problem: user or business problem addressed\n"
+    "  - proposal: summary of the solution\n"
+    "  - business_value: expected impact or ROI\n"
+    "  - confidence_score: 0.0-1.0 confidence in this idea."
+)
+
+
+def _default_model() -> str:
+    """Return the model used for idea generation (``REASONING_MODEL``)."""
+    return os.getenv("REASONING_MODEL", "gpt-4o")
+
+
+class Idea(TypedDict):
+    """Schema of a single roadmap idea returned by the model.
+
+    A ``TypedDict`` rather than a ``BaseModel``: pydantic validates straight
+    into a plain dict, without building a model instance only to dump it.
+    """
+
+    # Models sometimes answer e.g. ``business_value`` with a bare number;
+    # unknown keys are dropped
+    __pydantic_config__ = ConfigDict(coerce_numbers_to_str=True, extra="ignore")
+
+    title: str
+    problem: str
+    proposal: str
+    business_value: str
+    confidence_score: float
+
+
+_IDEA_ADAPTER = TypeAdapter(Idea)
 
 
 class ReasoningEngine:
     """Reasoning engine that generates product roadmap ideas using GPT-4o."""
 
-    def __init__(self, model_name: str = "gpt-4o") -> None:
-        self.model_name = model_name
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    def __init__(self, model_name: Optional[str] = None) -> None:
+        self.model_name = model_name or _default_model()
+        self.client = get_client()
 
     def analyze(
         self,
@@ -32,34 +86,111 @@ class ReasoningEngine:
         List of idea dicts with keys 'title', 'problem', 'proposal', 'business_value', 'confidence_score'.
         """
         return generate_new_ideas(
+            docs=documents,
+            jira_ideas=jira_issues,
             client=self.client,
             model_name=self.model_name,
+        )
+
+    def analyze_stream(
+        self,
+        documents: List[Dict[str, Any]],
+        jira_issues: List[Dict[str, Any]],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Like :meth:`analyze` but yield ideas one by one while they are generated.
+        """
+        return iter_new_ideas(
             docs=documents,
             jira_ideas=jira_issues,
+            client=self.client,
+            model_name=self.model_name,
         )
 
+    def analyze_batch(
+        self,
+        projects: List[Dict[str, Any]],
+        poll_interval: float = 30.0,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Generate ideas for several projects at once through the OpenAI Batch API.
+
+        Batch requests are billed at a discount but may take up to 24 hours, so
+        this is meant for scheduled, non-interactive runs; use :meth:`analyze`
+        for interactive use.
 
-@retry(stop=stop_after_attempt(4), wait=wait_random_exponential(min=1, max=10))
-def generate_new_ideas(
-    client: OpenAI,
-    model_name: str,
+        Parameters
+        ----------
+        projects : List of dicts with keys 'id', 'documents' and 'jira_issues'.
+        poll_interval : Seconds to wait between batch status checks.
+
+        Returns
+        -------
+        Mapping of project id to its list of idea dicts. Projects whose request
+        failed map to an empty list.
+        """
+        lines = []
+        for project in projects:
+            lines.append(fast_json.dumps({
+                "custom_id": str(project["id"]),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model_name,
+                    "messages": _build_messages(
+                        project.get("documents", []), project.get("jira_issues", [])
+                    ),
+                    "temperature": 0.7,
+                    "response_format": _RESPONSE_FORMAT,
+                },
+            }))
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+        input_file = self.client.files.create(
+            file=("ideas_batch.jsonl", payload), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        while batch.status not in _BATCH_FINAL_STATES:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        results: Dict[str, List[Dict[str, Any]]] = {str(p["id"]): [] for p in projects}
+        if batch.status != "completed" or not batch.output_file_id:
+            return results
+
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = fast_json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            choices = response.get("body", {}).get("choices") or [{}]
+            content = choices[0].get("message", {}).get("content") or ""
+            results[record["custom_id"]] = _parse_ideas(content)
+        return results
+
+
+def _format_doc(doc: Dict[str, Any]) -> str:
+    """Return the prompt snippet for a single documentation page."""
+    # Use the first available text field
+    text = doc.get("content") or doc.get("text") or doc.get("body") or ""
+    title = doc.get("title")
+    return f"### {title}\n{text}" if title else text
+
+
+def _build_messages(
     docs: List[Dict[str, Any]],
     jira_ideas: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
-    """
-    Generates novel roadmap ideas by prompting GPT-4o with both documentation and
-    detailed Jira issue information.
-    """
+) -> List[Dict[str, str]]:
+    """Return the chat messages asking the model for new roadmap ideas."""
     # Prepare documentation text
-    doc_snippets = []
-    for d in docs:
-        # Join available text fields
-        text = d.get("content") or d.get("text") or d.get("body") or ""
-        if title := d.get("title"):
-            doc_snippets.append(f"### {title}\n{text}")
-        else:
-            doc_snippets.append(text)
-    docs_text = "\n\n".join(doc_snippets)
+    docs_text = "\n\n".join([_format_doc(d) for d in docs])
 
     # Prepare existing Jira ideas summary
     issue_lines = []
@@ -75,45 +206,89 @@ def generate_new_ideas(
     issues_text = "\n".join(issue_lines)
 
     # Build prompts
-    system_prompt = (
-        "You are an expert product manager and consultant. Generate strategic, novel product roadmap ideas."
-    )
-    user_prompt = (
-        "Project Documentation:\n" + docs_text +
-        "\n\nExisting Jira Issues:\n" + issues_text +
-        "\n\nPlease propose 2-5 new, non-overlapping roadmap ideas in JSON array format."
-        " Each idea should be an object with keys:\n"
-        "  - title: concise idea name\n"
-        "  - problem: user or business problem addressed\n"
-        "  - proposal: summary of the solution\n"
-        "  - business_value: expected impact or ROI\n"
-        "  - confidence_score: 0.0-1.0 confidence in this idea."
-    )
+    user_prompt = _USER_PROMPT_TEMPLATE.format(docs=docs_text, issues=issues_text)
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def _validate_idea(item: Any) -> Optional[Dict[str, Any]]:
+    """Return ``item`` as an idea dict, or ``None`` if it does not match the schema."""
+    try:
+        return _IDEA_ADAPTER.validate_python(item)
+    except ValidationError:
+        return None
+
+
+def _parse_ideas(content: str) -> List[Dict[str, Any]]:
+    """Parse the model output into a list of well-formed idea dicts."""
+    try:
+        ideas = fast_json.loads(content)
+    except fast_json.JSONDecodeError:
+        # If parsing fails, return empty list
+        return []
+    if isinstance(ideas, dict):
+        ideas = ideas["ideas"] if "ideas" in ideas else [ideas]
+    if not isinstance(ideas, list):
+        return []
+
+    # Validate idea structure, dropping ideas that do not match the schema
+    validated = (_validate_idea(idea) for idea in ideas)
+    return [idea for idea in validated if idea is not None]
+
 
+@retry(stop=stop_after_attempt(4), wait=wait_random_exponential(min=1, max=10))
+def generate_new_ideas(
+    docs: List[Dict[str, Any]],
+    jira_ideas: List[Dict[str, Any]],
+    client: Optional[OpenAI] = None,
+    model_name: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Generates novel roadmap ideas by prompting GPT-4o with both documentation and
+    detailed Jira issue information. Uses the shared client unless one is given.
+    """
+    client = client or get_client()
     # Call OpenAI API
     response = client.chat.completions.create(
-        model=model_name,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
+        model=model_name or _default_model(),
+        messages=_build_messages(docs, jira_ideas),
         temperature=0.7,
+        response_format=_RESPONSE_FORMAT,
     )
 
     content = response.choices[0].message.content or ""
+    return _parse_ideas(content)
 
-    try:
-        ideas = json.loads(content)
-        if isinstance(ideas, dict):
-            ideas = [ideas]
-        # Validate idea structure
-        valid_ideas: List[Dict[str, Any]] = []
-        for idea in ideas:
-            if all(k in idea for k in [
-                "title", "problem", "proposal", "business_value", "confidence_score"
-            ]):
-                valid_ideas.append(idea)
-        return valid_ideas
-    except json.JSONDecodeError:
-        # If parsing fails, return empty list
-        return []
+
+def iter_new_ideas(
+    docs: List[Dict[str, Any]],
+    jira_ideas: List[Dict[str, Any]],
+    client: Optional[OpenAI] = None,
+    model_name: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of :func:`generate_new_ideas`.
+
+    The completion is streamed and each idea is yielded as soon as its JSON
+    object is complete, so callers can compose and deduplicate ideas while the
+    model is still generating the rest.
+    """
+    client = client or get_client()
+    stream = client.chat.completions.create(
+        model=model_name or _default_model(),
+        messages=_build_messages(docs, jira_ideas),
+        temperature=0.7,
+        response_format=_RESPONSE_FORMAT,
+        stream=True,
+    )
+    deltas = (
+        chunk.choices[0].delta.content or ""
+        for chunk in stream
+        if chunk.choices
+    )
+    for item in fast_json.iter_array_items(deltas, key="ideas"):
+        idea = _validate_idea(item)
+        if idea is not None:
+            yield idea
@@ -9,6 +9,6 @@ class IdeaExporter:
 
     def export_markdown(self, ideas: list, path: str) -> None:
         """Export ideas as a Markdown file."""
+        content = "".join(f"- {idea}\n" for idea in ideas)
         with open(path, "w", encoding="utf-8") as f:
-            for idea in ideas:
-                f.write(f"- {idea}\n")
+            f.write(content)
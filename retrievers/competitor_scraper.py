@@ -1,11 +1,8 @@
 import os
-import json
 from typing import Any, Dict, List
-from openai import OpenAI
 
-# Initialize OpenAI client for web-capable GPT model
-dotenv_api_key = os.getenv("OPENAI_API_KEY")
-_client = OpenAI(api_key=dotenv_api_key)
+import fast_json
+from llm_modules.openai_client import get_client
 
 
 def fetch_competitors(params: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -34,30 +31,29 @@ def fetch_competitors(params: Dict[str, Any]) -> List[Dict[str, Any]]:
     user_prompt = (
         f"Find the top {max_res} competitors for the product or domain '{product}'. "
         "For each competitor, provide its name, website URL, and a concise description. "
-        "Respond strictly in JSON as a list of objects with keys 'name', 'url', 'description'."
+        "Respond with a JSON object whose 'competitors' key holds a list of objects "
+        "with keys 'name', 'url', 'description'."
     )
 
-    response = _client.chat.completions.create(
+    response = get_client().chat.completions.create(
         model=os.getenv("LLM_MODEL", "gpt-4o"),
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt}
         ],
-        # ensure function calling is bypassed so we get plain JSON
-        function_call=None
+        # JSON mode guarantees a parseable object without Markdown fences
+        response_format={"type": "json_object"}
     )
     content = response.choices[0].message.content
 
     try:
-        competitors = json.loads(content)
-    except json.JSONDecodeError:
-        # In case of minor formatting issues, try to clean and parse
-        cleaned = content.strip().strip('`')
-        try:
-            competitors = json.loads(cleaned)
-        except Exception:
-            competitors = []
-    return competitors
+        data = fast_json.loads(content)
+    except (fast_json.JSONDecodeError, TypeError):
+        # Empty content or a truncated (finish_reason=length) reply
+        return []
+    if isinstance(data, dict):
+        data = data.get("competitors")
+    return data if isinstance(data, list) else []
 
 # Example registration in AgentOrchestrator.py:
 # from retrievers.competitor_scrapper import fetch_competitors
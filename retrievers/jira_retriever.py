@@ -1,17 +1,131 @@
 #!/usr/bin/env python3
+import base64
 import os
+import sqlite3
+import sys
+import threading
+import time
 import logging
 import requests
-from typing import List, Dict, Any
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional, Sequence, Tuple
 
-# 1) Načtení .env proměnných
-load_dotenv()
-JIRA_URL         = os.getenv("JIRA_URL")
-JIRA_USER        = os.getenv("JIRA_USER")
-JIRA_AUTH_TOKEN  = os.getenv("JIRA_AUTH_TOKEN")
-JIRA_JQL         = os.getenv("JIRA_JQL", "project = P4 ORDER BY created DESC")
-JIRA_MAX_RESULTS = int(os.getenv("JIRA_MAX_RESULTS", "50"))
+import fast_json
+
+# 1) Konstanty; nastavení z prostředí se čte až při prvním použití, viz _config()
+JIRA_PAGE_SIZE   = 500  # server může stránku zkrátit (Cloud na 100), viz níže
+JIRA_CONCURRENCY = 8    # max. souběžných požadavků kvůli rate limitům
+JIRA_FIELDS      = ("summary", "description", "status", "labels")
+JIRA_TIMEOUT     = 30   # s na připojení i čtení jedné odpovědi
+JIRA_CACHE_MAX_AGE = 7 * 24 * 3600  # s; starší stránky se z cache na disku mažou
+
+class _JiraConfig(NamedTuple):
+    url: Optional[str]
+    auth_header: Dict[str, str]  # hotová Basic auth hlavička, prázdná bez údajů
+    jql: str
+    max_results: int
+    cache_path: Optional[str]  # SQLite soubor cache stránek, None = bez cache
+    cache_ttl: float  # s, 0 = vždy revalidovat
+
+@lru_cache(maxsize=None)
+def _config() -> _JiraConfig:
+    """
+    Jednou přečte nastavení Jiry z proměnných prostředí; další volání jdou z cache.
+    .env načítá vstupní bod (AgentOrchestrator, __main__), ne import modulu.
+    """
+    url = os.getenv("JIRA_URL")
+    user = os.getenv("JIRA_USER")
+    token = os.getenv("JIRA_AUTH_TOKEN")
+    auth_header = {}
+    if user and token:
+        # base64 se spočítá jednou, ne při každém požadavku jako u auth=(user, token)
+        credentials = base64.b64encode(f"{user}:{token}".encode("utf-8")).decode("ascii")
+        auth_header["Authorization"] = f"Basic {credentials}"
+    return _JiraConfig(
+        url=url.rstrip("/") if url else url,  # ořez jednou, ne při každém požadavku
+        auth_header=auth_header,
+        jql=os.getenv("JIRA_JQL", "project = P4 ORDER BY created DESC"),
+        max_results=int(os.getenv("JIRA_MAX_RESULTS", "500")),
+        cache_path=os.getenv("JIRA_CACHE_PATH") or None,
+        cache_ttl=float(os.getenv("JIRA_CACHE_TTL", "0")),
+    )
+
+# Sdílená session: keep-alive spojení se znovu použijí napříč stránkami;
+# přechodné chyby (429, 5xx) opakuje už urllib3 a respektuje Retry-After
+_RETRY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    respect_retry_after_header=True,
+    raise_on_status=False,  # poslední odpověď zpracuje raise_for_status
+)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_RETRY)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+# gzip/deflate vždy, br/zstd jen pokud je nainstalovaný dekodér (brotli, zstandard)
+_SESSION.headers.update(make_headers(accept_encoding=True))
+_SESSION.headers["Accept"] = "application/json"
+
+class _CachedPage(NamedTuple):
+    fetched_at: float  # time.time() poslední odpovědi (200 i 304)
+    etag: str
+    meta: Dict[str, Any]  # stránka bez "issues" (total, maxResults, nextPageToken)
+    issues: List[Dict[str, Any]]  # už převedená issue, bez surového ADF
+
+class _PageCache:
+    """
+    SQLite cache stránek vyhledávání, přežije i mezi běhy agenta.
+    Drží ETag, metadata a převedená issue; spojení sdílí i vlákna
+    _iter_offset_pages, proto zámek.
+    """
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # autocommit: každá stránka se uloží hned, bez explicitního close()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY,"
+                " fetched_at REAL, etag TEXT, meta TEXT, issues TEXT)"
+            )
+            self._conn.execute(
+                "DELETE FROM pages WHERE fetched_at < ?", (time.time() - JIRA_CACHE_MAX_AGE,)
+            )
+
+    def get(self, key: str) -> Optional[_CachedPage]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, etag, meta, issues FROM pages WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, etag, meta, issues = row
+        return _CachedPage(fetched_at, etag, fast_json.loads(meta), fast_json.loads(issues))
+
+    def put(self, key: str, page: _CachedPage) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                (key, page.fetched_at, page.etag,
+                 fast_json.dumps(page.meta), fast_json.dumps(page.issues)),
+            )
+
+@lru_cache(maxsize=None)
+def _page_cache(path: str) -> _PageCache:
+    """
+    Jedna otevřená cache na soubor pro celý proces.
+    """
+    return _PageCache(path)
 
 # 2) Logger
 logger = logging.getLogger("jira_fetcher")
@@ -35,56 +149,265 @@ def _extract_adf_text(node: Dict[str, Any]) -> str:
             text += _extract_adf_text(item)
     return text
 
-def fetch_jira_issues(
-    jql: str = JIRA_JQL,
-    max_results: int = JIRA_MAX_RESULTS
-) -> List[Dict[str, Any]]:
+def _request(path: str, params: Dict[str, Any], headers: Dict[str, str]) -> requests.Response:
     """
-    Zavolá Jira REST API /search a vrátí seznam issue dictů:
-      { key, summary, description, status, labels }
+    GET na Jira REST API ``path`` s autorizací; chybový stav zaloguje a vyhodí.
     """
-    url = f"{JIRA_URL}/rest/api/3/search"
-    params = {
-        "jql": jql,
-        "maxResults": max_results,
-        "fields": "summary,description,status,labels"
-    }
-    auth = (JIRA_USER, JIRA_AUTH_TOKEN)
-    headers = {"Accept": "application/json"}
-
+    config = _config()
+    url = f"{config.url}{path}"
     logger.debug(f"GET {url} params={params}")
-    resp = requests.get(url, headers=headers, params=params, auth=auth)
+    # bez timeoutu by zaseknuté spojení blokovalo vlákno poolu (a agenta) navždy
+    resp = _SESSION.get(
+        url, headers={**config.auth_header, **headers}, params=params, timeout=JIRA_TIMEOUT
+    )
     try:
         resp.raise_for_status()
     except requests.HTTPError:
         logger.error(f"HTTP {resp.status_code} – {resp.text}")
         raise
+    return resp
 
-    data = resp.json()
-    issues = []
-    for issue in data.get("issues", []):
-        f = issue.get("fields", {})
-        # description může být None nebo ADF dict
-        raw_desc = f.get("description")
-        if raw_desc:
-            description = _extract_adf_text(raw_desc)
-        else:
-            description = ""
-        issues.append({
-            "key":         issue.get("key"),
-            "summary":     f.get("summary", ""),
-            "description": description,
-            "status":      f.get("status", {}).get("name", ""),
-            "labels":      f.get("labels", []),
-        })
+def _get_json(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    GET na Jira REST API ``path`` a vrátí dekódované JSON tělo (bez cache).
+    """
+    # surové bajty přes orjson, bez detekce kódování v resp.json()
+    return fast_json.loads(_request(path, params, {}).content)
 
+def _parse_issue_page(resp: requests.Response) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Rozdělí odpověď vyhledávání na metadata stránky a převedená issue.
+    """
+    # surové bajty přes orjson, bez detekce kódování v resp.json()
+    page = fast_json.loads(resp.content)
+    issues = _issues_from_page(page)
+    page.pop("issues", None)  # surová issue (ADF) se dál nedrží
+    return page, issues
+
+def _get_issue_page(
+    path: str, params: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Stáhne stránku vyhledávání a vrátí (metadata stránky, převedená issue).
+    S JIRA_CACHE_PATH se stránka ukládá do SQLite: mladší než ``cache_ttl``
+    se vrátí bez požadavku, starší se revaliduje přes If-None-Match
+    a při 304 se použije uložená.
+    """
+    config = _config()
+    if not config.cache_path:
+        return _parse_issue_page(_request(path, params, {}))
+
+    cache = _page_cache(config.cache_path)
+    key = fast_json.dumps([f"{config.url}{path}", params], sort_keys=True)
+    cached = cache.get(key)
+    if cached and time.time() - cached.fetched_at < config.cache_ttl:
+        return cached.meta, cached.issues
+
+    headers = {"If-None-Match": cached.etag} if cached and cached.etag else {}
+    resp = _request(path, params, headers)
+    if resp.status_code == 304 and cached:
+        # 304 nemusí ETag opakovat -> ponechat ten uložený
+        entry = cached._replace(
+            fetched_at=time.time(),
+            etag=resp.headers.get("ETag") or cached.etag,
+        )
+    else:
+        meta, issues = _parse_issue_page(resp)
+        entry = _CachedPage(time.time(), resp.headers.get("ETag", ""), meta, issues)
+    cache.put(key, entry)
+    return entry.meta, entry.issues
+
+def _get_page(
+    base_params: Dict[str, Any], start_at: int, max_results: int
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Stáhne jednu stránku výsledků /search od pozice ``start_at``.
+    ``base_params`` (jql, fields) jsou pro všechny stránky stejné a sestaví se jednou.
+    """
+    return _get_issue_page(
+        "/rest/api/3/search",
+        {**base_params, "startAt": start_at, "maxResults": max_results}
+    )
+
+def _issue_from_raw(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Převede surové issue z API na dict { key, summary, description, status, labels }.
+    """
+    f = issue["fields"]
+    # description může být None nebo ADF dict, status může být null
+    raw_desc = f.get("description")
+    status = f.get("status")
+    # stavy a labely se opakují napříč issue -> jedna sdílená instance řetězce
+    return {
+        "key":         issue["key"],
+        "summary":     f.get("summary") or "",
+        "description": _extract_adf_text(raw_desc) if raw_desc else "",
+        "status":      sys.intern(status["name"]) if status else "",
+        "labels":      [sys.intern(label) for label in f.get("labels") or ()],
+    }
+
+def _issues_from_page(page: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Převede všechna issue jedné stránky přes _issue_from_raw.
+    """
+    return [_issue_from_raw(issue) for issue in page.get("issues", [])]
+
+def _get_page_issues(
+    base_params: Dict[str, Any], start_at: int, max_results: int
+) -> List[Dict[str, Any]]:
+    """
+    Stáhne stránku a rovnou převede její issue; běží ve vlákně, takže převod
+    jedné stránky se překrývá s čekáním na síť u ostatních.
+    """
+    return _get_page(base_params, start_at, max_results)[1]
+
+def _iter_offset_pages(
+    jql: str, max_results: int, fields: str, max_workers: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    První stránka zjistí ``total``, zbylé stránky se stahují souběžně
+    v ThreadPoolExecutoru; rozpracovaných je nejvýš ``max_workers`` stránek
+    a další se zadá, jakmile si volající převezme nejstarší.
+    Vrací převedená issue po stránkách, v pořadí ``startAt``. Prázdná nebo
+    kratší stránka znamená konec dat, i když ``total`` tvrdí něco jiného.
+    """
+    if max_results <= 0:
+        return  # nic ke stažení; page_size 0 by rozbil range() níže
+    base_params = {"jql": jql, "fields": fields}
+    page_size = min(max_results, JIRA_PAGE_SIZE)
+    first, first_issues = _get_page(base_params, 0, page_size)
+    limit = min(first.get("total", 0), max_results)
+
+    # server může stránku zkrátit (Cloud na 100); skutečný limit vrací v "maxResults"
+    server_size = first.get("maxResults") or len(first_issues)
+    if 0 < server_size < page_size and server_size < limit:
+        logger.warning(
+            f"Server zkrátil stránku na {server_size} issue (požadováno {page_size}), "
+            "další stránky stahuji po této velikosti."
+        )
+        page_size = server_size
+    yield first_issues
+    if len(first_issues) < min(page_size, limit):
+        return
+
+    def submit(start_at: int) -> Tuple[int, Future]:
+        size = min(page_size, limit - start_at)
+        return size, executor.submit(_get_page_issues, base_params, start_at, size)
+
+    starts = iter(range(page_size, limit, page_size))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(submit(s) for s in islice(starts, max_workers))
+        try:
+            while pending:
+                size, future = pending.popleft()
+                issues = future.result()
+                if len(issues) < size:
+                    # konec dat dřív, než hlásil total -> další stránky nezadávat
+                    yield issues
+                    return
+                for start_at in islice(starts, 1):
+                    pending.append(submit(start_at))
+                yield issues
+        finally:
+            # volající skončil dřív (např. islice) -> nestahovat zbytečně
+            for _, future in pending:
+                future.cancel()
+
+def _iter_token_pages(jql: str, max_results: int, fields: str) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Enhanced search /search/jql: stránkuje se přes ``nextPageToken``, dokud ho
+    server vrací. Každá stránka potřebuje token té předchozí, stahují se postupně.
+    """
+    params: Dict[str, Any] = {"jql": jql, "fields": fields}
+    fetched = 0
+    while fetched < max_results:
+        params["maxResults"] = min(JIRA_PAGE_SIZE, max_results - fetched)
+        page, issues = _get_issue_page("/rest/api/3/search/jql", params)
+        yield issues
+        returned = len(issues)
+        token = page.get("nextPageToken")
+        if not returned or not token:
+            break
+        fetched += returned
+        params["nextPageToken"] = token
+
+def iter_jira_issues(
+    jql: Optional[str] = None,
+    max_results: Optional[int] = None,
+    fields: Sequence[str] = JIRA_FIELDS,
+    use_enhanced_search: bool = True,
+    max_workers: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Generátorová varianta fetch_jira_issues: issue vrací průběžně po stránkách,
+    v paměti je tak najednou nejvýš JIRA_CONCURRENCY surových stránek.
+    S ``use_enhanced_search=False`` se použije starší /search se ``startAt``.
+    Bez ``jql``/``max_results`` se použije JIRA_JQL/JIRA_MAX_RESULTS z prostředí.
+    ``max_workers`` (výchozí JIRA_CONCURRENCY) omezuje souběžné stránky u /search.
+    """
+    config = _config()
+    if not config.url:
+        raise EnvironmentError("Chybí proměnná prostředí JIRA_URL.")
+    jql = config.jql if jql is None else jql
+    max_results = config.max_results if max_results is None else max_results
+    fields_param = ",".join(fields)
+    if use_enhanced_search:
+        pages = _iter_token_pages(jql, max_results, fields_param)
+    else:
+        pages = _iter_offset_pages(
+            jql, max_results, fields_param, max_workers or JIRA_CONCURRENCY
+        )
+    issues = chain.from_iterable(pages)
+    return islice(issues, max_results)
+
+def fetch_jira_issues(
+    jql: Optional[str] = None,
+    max_results: Optional[int] = None,
+    fields: Sequence[str] = JIRA_FIELDS,
+    use_enhanced_search: bool = True,
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Zavolá Jira REST API /search/jql a vrátí seznam issue dictů:
+      { key, summary, description, status, labels }
+    S ``use_enhanced_search=False`` volá starší /search, kde se stránky
+    přesahující první stránku stahují souběžně (nejvýš ``max_workers`` najednou).
+    Z Jiry se stahují jen ``fields``; nevyžádaná pole mají prázdnou hodnotu.
+    """
+    issues = list(iter_jira_issues(jql, max_results, fields, use_enhanced_search, max_workers))
     logger.info(f"Načteno {len(issues)} issue(s).")
     return issues
 
+async def fetch_jira_issues_many(
+    jqls: Sequence[str],
+    max_results: Optional[int] = None,
+    fields: Sequence[str] = JIRA_FIELDS,
+    use_enhanced_search: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Spustí fetch_jira_issues pro každý JQL (např. jeden na projekt) souběžně
+    a vrátí issue všech dotazů v pořadí ``jqls``; ``max_results`` platí na dotaz.
+    """
+    # asyncio (~30 ms importu) potřebuje jen tato korutina; kdo ji awaituje,
+    # má ho už načtený, takže import modulu ho platit nemusí
+    import asyncio
+
+    results = await asyncio.gather(*(
+        asyncio.to_thread(fetch_jira_issues, jql, max_results, fields, use_enhanced_search)
+        for jql in jqls
+    ))
+    return [issue for issues in results for issue in issues]
+
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
     all_issues = fetch_jira_issues()
-    for iss in all_issues:
-        print(f"{iss['key']:10} | {iss['status']:15} | {iss['summary']}")
-        print(f"  Labels: {', '.join(iss['labels']) or '-'}")
-        print(f"  Description:\n{iss['description'] or '- žádný popis -'}")
-        print("-" * 80)
+    separator = "-" * 80
+    sys.stdout.write("".join(
+        f"{iss['key']:10} | {iss['status']:15} | {iss['summary']}\n"
+        f"  Labels: {', '.join(iss['labels']) or '-'}\n"
+        f"  Description:\n{iss['description'] or '- žádný popis -'}\n"
+        f"{separator}\n"
+        for iss in all_issues
+    ))
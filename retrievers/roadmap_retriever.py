@@ -3,72 +3,250 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Set
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Set
 from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+import fast_json
+
+# Elements whose text never belongs in a document; shared by both parsers
+_STRIP_TAGS = ("script", "style")
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - exercised only without the wheel
+    lxml_html = None
+else:
+    # Compiled once; each is a single C-level pass over the parsed tree
+    _STRIP_XPATH = etree.XPath("|".join(f"//{tag}" for tag in _STRIP_TAGS))
+    _LINKS_XPATH = etree.XPath("//a/@href")
+
+# Shared session so every page of a crawl reuses the same keep-alive
+# connection to the roadmap host instead of a new TCP/TLS handshake per page
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.headers["Accept"] = "text/html,application/xhtml+xml"
+
+
+def _clean_lines(text: str) -> str:
+    """Strip every line of ``text`` and drop the empty ones."""
+    # One C-level pass (map/filter) without building intermediate lists
+    return "\n".join(filter(None, map(str.strip, text.splitlines())))
 
 
 def _extract_text(html: str) -> str:
     """Return clean text from HTML preserving basic structure."""
-    soup = BeautifulSoup(html, "html.parser")
+    return _parse_page("", html).content
+
 
-    for tag in soup(["script", "style"]):
+def _extract_text_from_soup(soup: BeautifulSoup) -> str:
+    """Return clean text from an already parsed page.
+
+    ``script`` and ``style`` elements are removed from ``soup`` in place.
+    """
+
+    for tag in soup(_STRIP_TAGS):
         tag.decompose()
 
     # Use newline as separator to roughly keep paragraphs and headings
-    text = soup.get_text("\n")
-    lines = [line.strip() for line in text.splitlines()]
-    # Remove empty lines but keep intentional paragraph breaks
-    cleaned = "\n".join([line for line in lines if line])
-    return cleaned
+    return _clean_lines(soup.get_text("\n"))
+
+
+class _CachedPage(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    title: str
+    content: str
+    links: List[str]
 
 
-def retrieve_roadmap_documents(base_url: str) -> List[Dict[str, str]]:
+class _PageCache:
+    """SQLite store of HTTP validators and extracted content of crawled pages.
+
+    Used only from the crawling thread; workers just perform the requests.
+    """
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, etag TEXT,"
+            " last_modified TEXT, title TEXT, content TEXT, links TEXT)"
+        )
+
+    def get(self, url: str) -> Optional[_CachedPage]:
+        row = self._conn.execute(
+            "SELECT etag, last_modified, title, content, links FROM pages WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, title, content, links = row
+        return _CachedPage(etag, last_modified, title, content, fast_json.loads(links))
+
+    def put(self, url: str, response: requests.Response, page: _CachedPage) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            # nothing to revalidate with next time
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, page.title, page.content, fast_json.dumps(page.links)),
+        )
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM pages")
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+
+def _conditional_headers(cached: Optional[_CachedPage]) -> Dict[str, str]:
+    """Return ``If-None-Match``/``If-Modified-Since`` headers for ``cached``."""
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+def _fetch(url: str, headers: Dict[str, str]) -> Optional[requests.Response]:
+    """Return the response for ``url``, or ``None`` if the request fails."""
+    try:
+        response = _SESSION.get(url, timeout=30, headers=headers)
+        response.raise_for_status()
+    except requests.RequestException:
+        return None
+    return response
+
+
+def _parse_page(url: str, html: str) -> _CachedPage:
+    """Extract title, text and outgoing links of a page with a single parse.
+
+    Uses ``lxml.html`` and precompiled XPath expressions, which avoids the
+    Python wrapper object BeautifulSoup creates for every node; BeautifulSoup
+    is only the fallback when lxml is missing or rejects the document.
+    """
+    if lxml_html is None:
+        return _parse_page_soup(url, html)
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        # empty document, or a str carrying an XML encoding declaration
+        return _parse_page_soup(url, html)
+
+    # title and links are read before script/style are stripped
+    title = tree.findtext(".//title")
+    links = [str(href) for href in _LINKS_XPATH(tree)]
+    for element in _STRIP_XPATH(tree):
+        element.drop_tree()  # keeps the text that follows the element
+    # separate text nodes by newlines, like get_text("\n")
+    content = _clean_lines("\n".join(tree.itertext()))
+    return _CachedPage(None, None, title.strip() if title else url, content, links)
+
+
+def _parse_page_soup(url: str, html: str) -> _CachedPage:
+    """BeautifulSoup variant of :func:`_parse_page`."""
+    # title and links are read before the text extraction strips
+    # script/style from the tree
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.string.strip() if soup.title and soup.title.string else url
+    links = [link["href"] for link in soup.find_all("a", href=True)]
+    content = _extract_text_from_soup(soup)
+    return _CachedPage(None, None, title, content, links)
+
+
+def retrieve_roadmap_documents(
+    base_url: str,
+    max_workers: int = 16,
+    cache_path: Optional[str] = None,
+    refresh: bool = False,
+) -> List[Dict[str, str]]:
     """Crawl all pages under ``base_url`` and return their text content.
 
+    The crawl proceeds breadth-first: every page discovered on one level is
+    fetched concurrently before the next level is expanded, so documents are
+    returned in a deterministic order.
+
     Parameters
     ----------
     base_url:
         Root URL of the roadmap. All subpages beginning with this URL will be
         fetched recursively.
+    max_workers:
+        Maximum number of pages downloaded at the same time.
+    cache_path:
+        SQLite file remembering each page's ``ETag``/``Last-Modified`` and
+        extracted content. Pages are then requested conditionally and a
+        ``304 Not Modified`` reuses the stored content without parsing.
+        Defaults to ``ROADMAP_CACHE_PATH``; caching is off when neither is set.
+    refresh:
+        Discard the stored pages first so every page is downloaded and parsed
+        again; the cache is then refilled from the fresh responses.
     """
 
-    visited: Set[str] = set()
     documents: List[Dict[str, str]] = []
-    queue: List[str] = [base_url.rstrip("/")]
+    level: List[str] = [base_url.rstrip("/")]
+    # every URL ever queued; checked before queuing so that a link repeated
+    # on many pages (e.g. navigation) is fetched and parsed only once
+    enqueued: Set[str] = set(level)
 
     parsed_base = urlparse(base_url)
     base_netloc = parsed_base.netloc
 
-    while queue:
-        url = queue.pop()
-        if url in visited:
-            continue
-        visited.add(url)
-
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-        except requests.RequestException:
-            continue
-
-        html = response.text
-        soup = BeautifulSoup(html, "html.parser")
-        title = soup.title.string.strip() if soup.title and soup.title.string else url
-        content = _extract_text(html)
-        documents.append({"title": title, "url": url, "content": content})
-
-        for link in soup.find_all("a", href=True):
-            href = link["href"].strip()
-            absolute = urljoin(url, href)
-            parsed = urlparse(absolute)
-            if parsed.netloc != base_netloc:
-                continue
-            if not absolute.startswith(base_url.rstrip("/")):
-                continue
-            if absolute not in visited:
-                queue.append(absolute)
+    cache_path = cache_path or os.getenv("ROADMAP_CACHE_PATH")
+    cache = _PageCache(cache_path) if cache_path else None
+    if cache and refresh:
+        cache.clear()
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while level:
+                cached = [cache.get(url) if cache else None for url in level]
+                headers = [_conditional_headers(entry) for entry in cached]
+                next_level: List[str] = []
+                for url, entry, response in zip(
+                    level, cached, executor.map(_fetch, level, headers)
+                ):
+                    if response is None:
+                        continue
+
+                    if response.status_code == 304 and entry is not None:
+                        page = entry
+                    else:
+                        page = _parse_page(url, response.text)
+                        if cache:
+                            cache.put(url, response, page)
+                    documents.append({"title": page.title, "url": url, "content": page.content})
+
+                    for href in page.links:
+                        absolute = urljoin(url, href.strip())
+                        parsed = urlparse(absolute)
+                        if parsed.netloc != base_netloc:
+                            continue
+                        if not absolute.startswith(base_url.rstrip("/")):
+                            continue
+                        if absolute not in enqueued:
+                            enqueued.add(absolute)
+                            next_level.append(absolute)
+                level = next_level
+    finally:
+        if cache:
+            cache.close()
 
     return documents
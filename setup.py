@@ -12,7 +12,10 @@ setup(
         "requests>=2.31",
         "streamlit>=1.28",
         "beautifulsoup4>=4.12",
-        "pydantic>=2.0",
+        "lxml>=4.9",
+        "pydantic>=2.6",
+        "orjson>=3.9",
+        "xxhash>=3.0",
         "tenacity>=8.0",
         "python-dotenv>=1.0",
     ],
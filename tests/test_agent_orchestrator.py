@@ -0,0 +1,142 @@
+import json
+from types import SimpleNamespace
+
+import agent_orchestrator
+
+
+def make_tool_call(call_id, name, args):
+    return SimpleNamespace(
+        id=call_id, function=SimpleNamespace(name=name, arguments=json.dumps(args))
+    )
+
+
+def make_mock_client(turns):
+    requests = []
+    replies = iter(turns)
+
+    async def create(**kwargs):
+        requests.append(kwargs)
+        tool_calls, content = next(replies)
+        message = SimpleNamespace(tool_calls=tool_calls, content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return client, requests
+
+
+def test_run_dispatches_tool_calls_and_memoizes(monkeypatch, capsys):
+    calls = []
+
+    def fake_jira(params):
+        calls.append(("jira", params))
+        return [{"key": "PRJ-1"}]
+
+    def fake_roadmap(params):
+        calls.append(("roadmap", params))
+        return [{"title": "Doc"}]
+
+    monkeypatch.setitem(agent_orchestrator.TOOLS, "fetch_jira", fake_jira)
+    monkeypatch.setitem(agent_orchestrator.TOOLS, "fetch_roadmap", fake_roadmap)
+
+    client, requests = make_mock_client([
+        (
+            [
+                make_tool_call("a", "fetch_jira", {"jql": "project = P", "max_results": 5}),
+                make_tool_call("b", "fetch_roadmap", {"roadmap_url": "http://r"}),
+            ],
+            None,
+        ),
+        ([make_tool_call("c", "fetch_jira", {"max_results": 5, "jql": "project = P"})], None),
+        (None, "done"),
+    ])
+    monkeypatch.setattr(agent_orchestrator, "AsyncOpenAI", lambda *args, **kwargs: client)
+
+    agent_orchestrator.AgentOrchestrator().run("goal")
+
+    assert capsys.readouterr().out.strip() == "done"
+    # the repeated jira request is served from the per-run cache
+    assert sorted(name for name, _ in calls) == ["jira", "roadmap"]
+
+    messages = requests[-1]["messages"]
+    tool_messages = [m for m in messages if m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_messages] == ["a", "b", "c"]
+    assert json.loads(tool_messages[2]["content"]) == [{"key": "PRJ-1"}]
+
+
+def test_run_reuses_tool_results_across_retries(monkeypatch, capsys):
+    from tenacity import wait_none
+
+    calls = []
+
+    def fake_jira(params):
+        calls.append(params)
+        return [{"key": "PRJ-1"}]
+
+    def flaky_roadmap(params):
+        calls.append(params)
+        if len(calls) == 2:
+            raise RuntimeError("roadmap down")
+        return [{"title": "Doc"}]
+
+    monkeypatch.setitem(agent_orchestrator.TOOLS, "fetch_jira", fake_jira)
+    monkeypatch.setitem(agent_orchestrator.TOOLS, "fetch_roadmap", flaky_roadmap)
+    monkeypatch.setattr(agent_orchestrator.AgentOrchestrator.arun.retry, "wait", wait_none())
+
+    jira_call = make_tool_call("a", "fetch_jira", {"jql": "project = P"})
+    roadmap_call = make_tool_call("b", "fetch_roadmap", {"roadmap_url": "http://r"})
+    client, _ = make_mock_client([
+        # first attempt: the roadmap tool fails and the whole run is retried
+        ([jira_call], None),
+        ([roadmap_call], None),
+        # second attempt asks for the same tools again
+        ([jira_call], None),
+        ([roadmap_call], None),
+        (None, "done"),
+    ])
+    monkeypatch.setattr(agent_orchestrator, "AsyncOpenAI", lambda *args, **kwargs: client)
+
+    agent_orchestrator.AgentOrchestrator().run("goal")
+
+    assert capsys.readouterr().out.strip() == "done"
+    # jira ran once for both attempts; the failed roadmap call was not cached
+    assert calls == [
+        {"jql": "project = P"},
+        {"roadmap_url": "http://r"},
+        {"roadmap_url": "http://r"},
+    ]
+
+
+def test_fetch_jira_tool_passes_requested_fields(monkeypatch):
+    seen = {}
+
+    def fake_fetch(jql, max_results, fields):
+        seen.update(jql=jql, max_results=max_results, fields=fields)
+        return []
+
+    monkeypatch.setattr(agent_orchestrator, "fetch_jira_issues", fake_fetch)
+
+    agent_orchestrator._tool_fetch_jira({"jql": "project = P", "fields": ["summary"]})
+    assert seen == {"jql": "project = P", "max_results": 50, "fields": ["summary"]}
+
+    agent_orchestrator._tool_fetch_jira({"jql": "project = P"})
+    assert seen["fields"] == agent_orchestrator.JIRA_FIELDS
+
+    agent_orchestrator._tool_fetch_jira({"jql": "project = P", "fields": "summary, status"})
+    assert seen["fields"] == ["summary", "status"]
+
+    agent_orchestrator._tool_fetch_jira({"jql": "project = P", "fields": ["bogus", 3]})
+    assert seen["fields"] == agent_orchestrator.JIRA_FIELDS
+
+
+def test_fetch_roadmap_tool_passes_url(monkeypatch):
+    docs = [{"title": "Doc", "content": "doc"}]
+    seen = []
+
+    def fake_retrieve(url):
+        seen.append(url)
+        return docs
+
+    monkeypatch.setattr(agent_orchestrator, "retrieve_roadmap_documents", fake_retrieve)
+
+    assert agent_orchestrator._tool_fetch_roadmap({"roadmap_url": "http://example.com"}) == docs
+    assert seen == ["http://example.com"]
@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+import pytest
+
+import retrievers.competitor_scraper as competitor_scraper
+
+
+def make_client(content):
+    def create(**kwargs):
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def test_fetch_competitors_unwraps_competitors_key(monkeypatch):
+    competitor = {"name": "Acme", "url": "https://acme.example", "description": "d"}
+    content = '{"competitors": [{"name": "Acme", "url": "https://acme.example", "description": "d"}]}'
+    monkeypatch.setattr(competitor_scraper, "get_client", lambda: make_client(content))
+
+    assert competitor_scraper.fetch_competitors({"product_name": "P"}) == [competitor]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [None, '{"competitors": [{"name": "Ac', '{"competitors": "none"}', '"text"'],
+)
+def test_fetch_competitors_returns_empty_list_for_unusable_reply(monkeypatch, content):
+    monkeypatch.setattr(competitor_scraper, "get_client", lambda: make_client(content))
+
+    assert competitor_scraper.fetch_competitors({"product_name": "P"}) == []
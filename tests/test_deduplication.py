@@ -1,11 +1,5 @@
-import sys
-from pathlib import Path
-
 import pytest
 
-# Ensure project root is on the path when running tests directly
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from deduplication.checker import DeduplicationChecker
 
 
@@ -31,3 +25,38 @@ def test_hash_equivalence_between_dict_and_string():
     idea_dict = {"title": "  My Unique Idea  "}
     idea_str = "my unique idea"
     assert checker._hash_title(idea_dict) == checker._hash_title(idea_str)
+
+
+def test_check_and_add_records_first_occurrence():
+    checker = DeduplicationChecker()
+    assert checker.check_and_add({"title": "Dark mode"}) is False
+    assert checker.check_and_add("dark mode ") is True
+    assert checker.is_duplicate("Dark Mode") is True
+
+
+def test_state_is_persisted_between_checkers(tmp_path):
+    state = tmp_path / "state" / "seen_hashes.bin"
+    first = DeduplicationChecker(state_path=str(state))
+    first.add("Offline mode")
+    first.add({"title": "Bulk export"})
+    first.save()
+
+    assert state.stat().st_size == 16
+    second = DeduplicationChecker(state_path=str(state))
+    assert second.is_duplicate("offline mode") is True
+    assert second.is_duplicate("Bulk export") is True
+    assert second.is_duplicate("Something new") is False
+
+
+def test_truncated_state_file_keeps_complete_hashes(tmp_path, caplog):
+    state = tmp_path / "seen_hashes.bin"
+    first = DeduplicationChecker(state_path=str(state))
+    first.add("Offline mode")
+    first.save()
+    # simulate a partial write of a second hash
+    state.write_bytes(state.read_bytes() + b"\x01\x02\x03")
+
+    second = DeduplicationChecker(state_path=str(state))
+
+    assert second.is_duplicate("offline mode") is True
+    assert "truncated state file" in caplog.text
@@ -1,10 +1,3 @@
-import os
-import sys
-from pathlib import Path
-
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
-
 from output.export import IdeaExporter
 
 def test_export_markdown_creates_file_with_content(tmp_path):
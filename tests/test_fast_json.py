@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+import fast_json
+
+
+def test_dumps_roundtrip_keeps_unicode():
+    data = [{"id": "1", "title": "Nápad", "rating": 5}]
+    text = fast_json.dumps(data, indent=True)
+    assert "Nápad" in text
+    assert fast_json.loads(text) == data
+    assert json.loads(text) == data
+
+
+def test_loads_raises_stdlib_compatible_error():
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads("not valid")
+
+
+def test_loads_falls_back_to_jiter_without_orjson(monkeypatch):
+    pytest.importorskip("jiter")
+    monkeypatch.setattr(fast_json, "orjson", None)
+
+    assert fast_json.loads(b'{"title": "N\xc3\xa1pad", "n": [1, 2.5]}') == {
+        "title": "Nápad",
+        "n": [1, 2.5],
+    }
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads("not valid")
+
+
+def test_iter_array_items_yields_each_completed_element():
+    text = '```json\n{"ideas": [{"title": "A"}, {"title": "B [draft]"}]}\n```'
+    chunks = [text[i:i + 5] for i in range(0, len(text), 5)]
+    seen = []
+
+    def stream():
+        for chunk in chunks:
+            seen.append(chunk)
+            yield chunk
+
+    items = fast_json.iter_array_items(stream())
+    assert next(items) == {"title": "A"}
+    # the first element is available before the stream is exhausted
+    assert len(seen) < len(chunks)
+    assert list(items) == [{"title": "B [draft]"}]
+
+
+def test_iter_array_items_anchors_on_key_outside_strings():
+    text = '{"note": "see [1] and \\"ideas\\": [2]", "ideas": [{"title": "A"}]}'
+    chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+
+    assert list(fast_json.iter_array_items(chunks, key="ideas")) == [{"title": "A"}]
+
+
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        (["[1", "23, 4", "5]"], [123, 45]),
+        (["[0.", "5, 1]"], [0.5, 1]),
+        (["[1e", "3, 2]"], [1e3, 2]),
+    ],
+)
+def test_iter_array_items_waits_for_numbers_split_across_chunks(chunks, expected):
+    assert list(fast_json.iter_array_items(chunks)) == expected
@@ -1,8 +1,6 @@
 import json
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import pytest
 
 from feedback.collector import collect_ratings
 
@@ -22,3 +20,84 @@ def test_collect_ratings_writes_file(tmp_path, monkeypatch):
     assert fb_path.exists()
     data = json.loads(fb_path.read_text(encoding="utf-8"))
     assert data == [{"id": "1", "rating": 5}, {"id": "2", "rating": 3}]
+
+
+def test_collect_ratings_accepts_several_ratings_per_line(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    inputs = iter(["9", "4 2"])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    ideas = [
+        {"id": "1", "title": "Idea 1"},
+        {"id": "2", "title": "Idea 2"},
+    ]
+
+    collect_ratings(ideas)
+
+    data = json.loads((tmp_path / "output" / "feedback.json").read_text(encoding="utf-8"))
+    assert data == [{"id": "1", "rating": 4}, {"id": "2", "rating": 2}]
+
+
+def test_collect_ratings_reprompts_whole_line_with_invalid_rating(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("RATINGS_FILE", raising=False)
+    inputs = iter(["4 9 2", "5 3.5 4", "4 1 2"])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    ideas = [
+        {"id": "1", "title": "Idea 1"},
+        {"id": "2", "title": "Idea 2"},
+        {"id": "3", "title": "Idea 3"},
+    ]
+
+    collect_ratings(ideas)
+
+    data = json.loads((tmp_path / "output" / "feedback.json").read_text(encoding="utf-8"))
+    assert [item["rating"] for item in data] == [4, 1, 2]
+
+
+def test_collect_ratings_rejects_invalid_ratings_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ratings_file = tmp_path / "ratings.txt"
+    ratings_file.write_text("4 9 2\n", encoding="utf-8")
+    monkeypatch.setenv("RATINGS_FILE", str(ratings_file))
+
+    with pytest.raises(ValueError):
+        collect_ratings([{"id": "1", "title": "Idea 1"}])
+
+    assert not (tmp_path / "output" / "feedback.json").exists()
+
+
+def test_collect_ratings_reads_ratings_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ratings_file = tmp_path / "ratings.txt"
+    ratings_file.write_text("2, 5\n", encoding="utf-8")
+    monkeypatch.setenv("RATINGS_FILE", str(ratings_file))
+
+    def closed_stdin(_):
+        raise EOFError
+
+    monkeypatch.setattr("builtins.input", closed_stdin)
+    ideas = [
+        {"id": "1", "title": "Idea 1"},
+        {"id": "2", "title": "Idea 2"},
+        {"id": "3", "title": "Idea 3"},
+    ]
+
+    collect_ratings(ideas)
+
+    data = json.loads((tmp_path / "output" / "feedback.json").read_text(encoding="utf-8"))
+    assert data == [{"id": "1", "rating": 2}, {"id": "2", "rating": 5}]
+
+
+def test_collect_ratings_stops_on_closed_stdin(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("RATINGS_FILE", raising=False)
+
+    def closed_stdin(_):
+        raise EOFError
+
+    monkeypatch.setattr("builtins.input", closed_stdin)
+
+    collect_ratings([{"id": "1", "title": "Idea 1"}])
+
+    data = json.loads((tmp_path / "output" / "feedback.json").read_text(encoding="utf-8"))
+    assert data == []
@@ -1,10 +1,6 @@
-import sys
-import pathlib
+import asyncio
 import importlib
 
-# Ensure project root is on the path before importing the retriever
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
-
 import pytest
 
 
@@ -12,6 +8,7 @@ import pytest
 def jira_module(monkeypatch):
     monkeypatch.setenv("JIRA_URL", "https://jira.example.com")
     monkeypatch.setenv("JIRA_PROJECT_KEY", "PRJ")
+    monkeypatch.setenv("JIRA_USER", "user@example.com")
     monkeypatch.setenv("JIRA_AUTH_TOKEN", "token")
 
     from retrievers import jira_retriever
@@ -21,12 +18,11 @@ def jira_module(monkeypatch):
 
 import requests
 import requests_mock
-import tenacity
 
 
 def test_fetch_issues_pagination(jira_module, monkeypatch):
-    base_url = "https://jira.example.com"
-    search_url = base_url + "/rest/api/2/search"
+    search_url = "https://jira.example.com/rest/api/3/search"
+    monkeypatch.setattr(jira_module, "JIRA_PAGE_SIZE", 2)
 
     page1 = {
         "issues": [
@@ -34,7 +30,7 @@ def test_fetch_issues_pagination(jira_module, monkeypatch):
                 "key": "PRJ-1",
                 "fields": {
                     "summary": "S1",
-                    "description": "D1",
+                    "description": {"type": "doc", "content": [{"text": "D1"}]},
                     "status": {"name": "Todo"},
                     "labels": ["l1"],
                 },
@@ -60,7 +56,7 @@ def test_fetch_issues_pagination(jira_module, monkeypatch):
                 "key": "PRJ-3",
                 "fields": {
                     "summary": "S3",
-                    "description": "D3",
+                    "description": {"type": "doc", "content": [{"text": "D3"}]},
                     "status": {"name": "Done"},
                     "labels": ["l3"],
                 },
@@ -80,46 +76,39 @@ def test_fetch_issues_pagination(jira_module, monkeypatch):
             ],
         )
 
-        monkeypatch.setattr(jira_module, "JIRA_URL", base_url)
-
-        issues = jira_module.fetch_all_issues("PRJ", max_results=2)
+        issues = jira_module.fetch_jira_issues(
+            "project = PRJ", max_results=50, use_enhanced_search=False
+        )
 
         assert len(issues) == 3
-        assert issues[0].key == "PRJ-1"
-        assert issues[1].summary == "S2"
-        assert issues[2].status == "Done"
+        assert issues[0]["key"] == "PRJ-1"
+        assert issues[1]["summary"] == "S2"
+        assert issues[1]["description"] == ""
+        assert issues[2]["status"] == "Done"
 
         starts = [int(r.qs["startat"][0]) for r in m.request_history]
         assert starts == [0, 2]
 
 
-def test__jira_get_success_and_error(jira_module, monkeypatch):
-    url = "https://api.example.com"
-    params = {"a": "1"}
-    token = "tok"
-
-    monkeypatch.setattr(jira_module, "JIRA_URL", url)
+def test__get_json_success_and_error(jira_module):
+    url = "https://jira.example.com/rest/api/3/myself"
 
     with requests_mock.Mocker() as m:
-        m.get(url + "/", json={"ok": True}, status_code=200)
-        result = jira_module._jira_get("", params, token)
+        m.get(url, json={"ok": True}, status_code=200)
+        result = jira_module._get_json("/rest/api/3/myself", {"a": "1"})
         assert result == {"ok": True}
-        assert m.last_request.headers["Authorization"] == f"Basic {token}"
+        assert m.last_request.qs == {"a": ["1"]}
+        assert m.last_request.headers["Authorization"].startswith("Basic ")
+        assert m.last_request.timeout == jira_module.JIRA_TIMEOUT
 
     with requests_mock.Mocker() as m:
-        m.get(url + "/", status_code=500)
-        jira_module._jira_get.retry.stop = tenacity.stop_after_attempt(1)
-        jira_module._jira_get.retry.wait = tenacity.wait_none()
+        m.get(url, status_code=500)
         with pytest.raises(requests.HTTPError):
-            jira_module._jira_get("", params, token)
+            jira_module._get_json("/rest/api/3/myself", {"a": "2"})
 
 
-def test_fetch_all_issues(jira_module, monkeypatch):
-    url = "https://jira.example.com"
-    project = "PRJ"
-    search_url = url + "/rest/api/2/search"
-
-    monkeypatch.setattr(jira_module, "JIRA_URL", url)
+def test_fetch_jira_issues_single_issue(jira_module):
+    search_url = "https://jira.example.com/rest/api/3/search/jql"
 
     data = {
         "issues": [
@@ -127,22 +116,298 @@ def test_fetch_all_issues(jira_module, monkeypatch):
                 "key": "PRJ-1",
                 "fields": {
                     "summary": "S1",
-                    "description": "D1",
+                    "description": {"type": "doc", "content": [{"text": "D1"}]},
                     "status": {"name": "Todo"},
                 },
             }
         ],
-        "startAt": 0,
-        "maxResults": 50,
-        "total": 1,
+        "isLast": True,
     }
 
     with requests_mock.Mocker() as m:
         m.get(search_url, json=data, status_code=200)
-        issues = jira_module.fetch_all_issues(project_key=project)
+        issues = jira_module.fetch_jira_issues("project = PRJ")
         assert len(issues) == 1
         issue = issues[0]
-        assert issue.key == "PRJ-1"
-        assert issue.summary == "S1"
-        assert issue.description == "D1"
-        assert issue.status == "Todo"
+        assert issue["key"] == "PRJ-1"
+        assert issue["summary"] == "S1"
+        assert issue["description"] == "D1"
+        assert issue["status"] == "Todo"
+        assert issue["labels"] == []
+
+
+def _search_page(request, context):
+    start = int(request.qs["startat"][0])
+    # emulate Jira Cloud, which caps search pages at 100 issues
+    size = min(int(request.qs["maxresults"][0]), 100)
+    total = 250
+    return {
+        "startAt": start,
+        "maxResults": size,
+        "total": total,
+        "issues": [
+            {
+                "key": f"PRJ-{i}",
+                "fields": {
+                    "summary": f"S{i}",
+                    "description": {"type": "doc", "content": [{"text": f"D{i}"}]},
+                    "status": {"name": "Todo"},
+                    "labels": ["l"],
+                },
+            }
+            for i in range(start, min(start + size, total))
+        ],
+    }
+
+
+def test_fetch_jira_issues_fetches_all_pages(jira_module):
+    search_url = "https://jira.example.com/rest/api/3/search"
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_search_page)
+        issues = jira_module.fetch_jira_issues("project = PRJ", max_results=250, use_enhanced_search=False)
+
+    assert [i["key"] for i in issues] == [f"PRJ-{i}" for i in range(250)]
+    # repeated status/label strings share one interned instance
+    assert issues[0]["status"] is issues[249]["status"]
+    assert issues[0]["labels"][0] is issues[249]["labels"][0]
+    assert issues[1] == {
+        "key": "PRJ-1",
+        "summary": "S1",
+        "description": "D1",
+        "status": "Todo",
+        "labels": ["l"],
+    }
+    starts = sorted(int(r.qs["startat"][0]) for r in m.request_history)
+    assert starts == [0, 100, 200]
+
+
+def test_fetch_jira_issues_respects_max_results(jira_module):
+    search_url = "https://jira.example.com/rest/api/3/search"
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_search_page)
+        issues = jira_module.fetch_jira_issues("project = PRJ", max_results=30, use_enhanced_search=False)
+
+    assert len(issues) == 30
+    assert len(m.request_history) == 1
+
+
+def test_fetch_jira_issues_requests_only_given_fields(jira_module):
+    search_url = "https://jira.example.com/rest/api/3/search"
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_search_page)
+        issues = jira_module.fetch_jira_issues(
+            "project = PRJ",
+            max_results=1,
+            fields=("summary", "status"),
+            use_enhanced_search=False,
+        )
+
+    assert m.last_request.qs["fields"] == ["summary,status"]
+    assert issues[0]["summary"] == "S0"
+
+
+def test_fetch_jira_issues_revalidates_cached_page_with_etag(jira_module, monkeypatch, tmp_path):
+    search_url = "https://jira.example.com/rest/api/3/search"
+    monkeypatch.setenv("JIRA_CACHE_PATH", str(tmp_path / "jira.sqlite"))
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_search_page, headers={"ETag": '"v1"'})
+        first = jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+        m.get(search_url, status_code=304)
+        second = jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+
+    assert m.last_request.headers["If-None-Match"] == '"v1"'
+    assert second == first
+
+
+def test_revalidation_keeps_etag_when_304_omits_it(jira_module, monkeypatch, tmp_path):
+    search_url = "https://jira.example.com/rest/api/3/search"
+    monkeypatch.setenv("JIRA_CACHE_PATH", str(tmp_path / "jira.sqlite"))
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_search_page, headers={"ETag": '"v1"'})
+        first = jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+        m.get(search_url, status_code=304)
+        jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+        third = jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+
+    validators = [r.headers.get("If-None-Match") for r in m.request_history]
+    assert validators == [None, '"v1"', '"v1"']
+    assert third == first
+
+
+def test_page_cache_persists_across_processes(jira_module, monkeypatch, tmp_path):
+    search_url = "https://jira.example.com/rest/api/3/search"
+    monkeypatch.setenv("JIRA_CACHE_PATH", str(tmp_path / "jira.sqlite"))
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_search_page, headers={"ETag": '"v1"'})
+        first = jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+
+        # a fresh import stands in for the next agent run
+        importlib.reload(jira_module)
+        m.get(search_url, status_code=304)
+        second = jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+
+    assert m.last_request.headers["If-None-Match"] == '"v1"'
+    assert second == first
+
+
+def test_fetch_jira_issues_serves_fresh_page_from_cache(jira_module, monkeypatch, tmp_path):
+    search_url = "https://jira.example.com/rest/api/3/search"
+    monkeypatch.setenv("JIRA_CACHE_PATH", str(tmp_path / "jira.sqlite"))
+    monkeypatch.setenv("JIRA_CACHE_TTL", "300")
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_search_page)
+        jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+        jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+
+    assert m.call_count == 1
+
+
+def test_fetch_jira_issues_without_cache_path_always_requests(jira_module, monkeypatch):
+    search_url = "https://jira.example.com/rest/api/3/search"
+    monkeypatch.delenv("JIRA_CACHE_PATH", raising=False)
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_search_page, headers={"ETag": '"v1"'})
+        jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+        jira_module.fetch_jira_issues("project = PRJ", max_results=1, use_enhanced_search=False)
+
+    assert [r.headers.get("If-None-Match") for r in m.request_history] == [None, None]
+
+
+def test_issue_from_raw_tolerates_null_fields(jira_module):
+    raw = {
+        "key": "PRJ-1",
+        "fields": {"summary": None, "description": None, "status": None, "labels": None},
+    }
+
+    assert jira_module._issue_from_raw(raw) == {
+        "key": "PRJ-1",
+        "summary": "",
+        "description": "",
+        "status": "",
+        "labels": [],
+    }
+
+
+def test_iter_jira_issues_fetches_pages_lazily(jira_module):
+    search_url = "https://jira.example.com/rest/api/3/search"
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_search_page)
+        issues = jira_module.iter_jira_issues(
+            "project = PRJ", max_results=250, use_enhanced_search=False, max_workers=1
+        )
+        first = next(issues)
+        assert m.call_count == 1
+        rest = list(issues)
+
+    assert first["key"] == "PRJ-0"
+    assert len(rest) == 249
+    assert m.call_count == 3
+
+
+def _jql_page(request, context):
+    # enhanced search returns no total, only a token for the next page
+    start = int(request.qs.get("nextpagetoken", ["0"])[0])
+    size = int(request.qs["maxresults"][0])
+    end = min(start + size, 250)
+    page = {
+        "issues": [
+            {"key": f"PRJ-{i}", "fields": {"summary": f"S{i}"}}
+            for i in range(start, end)
+        ]
+    }
+    if end < 250:
+        page["nextPageToken"] = str(end)
+    return page
+
+
+def test_fetch_jira_issues_follows_next_page_token(jira_module, monkeypatch):
+    search_url = "https://jira.example.com/rest/api/3/search/jql"
+    monkeypatch.setattr(jira_module, "JIRA_PAGE_SIZE", 100)
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_jql_page)
+        issues = jira_module.fetch_jira_issues("project = PRJ", max_results=500)
+
+    assert [i["key"] for i in issues] == [f"PRJ-{i}" for i in range(250)]
+    assert m.last_request.headers["Authorization"] == (
+        "Basic dXNlckBleGFtcGxlLmNvbTp0b2tlbg=="  # user@example.com:token
+    )
+    assert "gzip" in m.last_request.headers["Accept-Encoding"]
+    assert m.last_request.headers["Accept"] == "application/json"
+    tokens = [r.qs.get("nextpagetoken") for r in m.request_history]
+    assert tokens == [None, ["100"], ["200"]]
+
+
+def test_fetch_jira_issues_many_runs_each_jql(jira_module):
+    search_url = "https://jira.example.com/rest/api/3/search/jql"
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=_jql_page)
+        issues = asyncio.run(
+            jira_module.fetch_jira_issues_many(
+                ["project = A", "project = B"], max_results=3
+            )
+        )
+
+    assert [i["key"] for i in issues] == ["PRJ-0", "PRJ-1", "PRJ-2"] * 2
+    assert sorted(r.qs["jql"][0] for r in m.request_history) == [
+        "project = a",
+        "project = b",
+    ]
+
+
+def test_fetch_jira_issues_strips_trailing_slash_from_url(jira_module, monkeypatch):
+    monkeypatch.setenv("JIRA_URL", "https://jira.example.com/")
+
+    with requests_mock.Mocker() as m:
+        m.get("https://jira.example.com/rest/api/3/search/jql", json=_jql_page)
+        jira_module.fetch_jira_issues("project = PRJ", max_results=1)
+
+    assert m.last_request.path == "/rest/api/3/search/jql"
+
+
+def test_offset_pagination_stops_at_first_short_page(jira_module):
+    search_url = "https://jira.example.com/rest/api/3/search"
+
+    def overstated_total(request, context):
+        page = _search_page(request, context)
+        # the server claims far more issues than it actually returns
+        page["total"] = 10_000
+        return page
+
+    with requests_mock.Mocker() as m:
+        m.get(search_url, json=overstated_total)
+        issues = jira_module.fetch_jira_issues(
+            "project = PRJ", max_results=10_000, use_enhanced_search=False, max_workers=1
+        )
+
+    assert len(issues) == 250
+    starts = [int(r.qs["startat"][0]) for r in m.request_history]
+    assert starts == [0, 100, 200]
+
+
+@pytest.mark.parametrize("use_enhanced_search", [True, False])
+def test_fetch_jira_issues_with_zero_max_results_makes_no_request(jira_module, use_enhanced_search):
+    with requests_mock.Mocker() as m:
+        issues = jira_module.fetch_jira_issues(
+            "project = PRJ", max_results=0, use_enhanced_search=use_enhanced_search
+        )
+
+    assert issues == []
+    assert m.call_count == 0
+
+
+def test_fetch_jira_issues_requires_jira_url(jira_module, monkeypatch):
+    monkeypatch.delenv("JIRA_URL")
+
+    with pytest.raises(EnvironmentError, match="JIRA_URL"):
+        jira_module.fetch_jira_issues("project = PRJ")
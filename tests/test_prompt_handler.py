@@ -1,11 +1,5 @@
-import os
-import sys
-
 import pytest
 
-# Ensure the project root is on the path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from ui.prompt_handler import PromptHandler
 
 
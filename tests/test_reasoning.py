@@ -18,6 +18,22 @@ def make_mock_openai(response_content):
     return mock_openai
 
 
+def make_mock_openai_stream(chunks):
+    def mock_create(*args, **kwargs):
+        assert kwargs.get("stream") is True
+        return iter(
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=chunk))])
+            for chunk in chunks
+        )
+
+    def mock_openai(*args, **kwargs):
+        return SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=mock_create))
+        )
+
+    return mock_openai
+
+
 def test_generate_new_ideas_valid_json(monkeypatch):
     expected = [
         {
@@ -28,14 +44,92 @@ def test_generate_new_ideas_valid_json(monkeypatch):
             "confidence_score": 0.8,
         }
     ]
-    mock_openai = make_mock_openai(json.dumps(expected))
-    monkeypatch.setattr(reasoning, "OpenAI", mock_openai)
+    mock_openai = make_mock_openai(json.dumps({"ideas": expected}))
+    monkeypatch.setattr(reasoning, "get_client", mock_openai)
     ideas = reasoning.generate_new_ideas([{"content": "doc"}], [])
     assert ideas == expected
 
 
 def test_generate_new_ideas_invalid_json(monkeypatch):
     mock_openai = make_mock_openai("not valid")
-    monkeypatch.setattr(reasoning, "OpenAI", mock_openai)
+    monkeypatch.setattr(reasoning, "get_client", mock_openai)
     ideas = reasoning.generate_new_ideas([{"content": "doc"}], [])
     assert ideas == []
+
+
+def test_generate_new_ideas_streaming(monkeypatch):
+    first = {
+        "title": "Idea",
+        "problem": "A problem",
+        "proposal": "A proposal",
+        "business_value": "High",
+        "confidence_score": 0.8,
+    }
+    second = dict(first, title="Other idea")
+    payload = json.dumps({"ideas": [first, second]})
+    # split mid-object so the first idea is only complete after a later chunk
+    cut = len(json.dumps({"ideas": [first]})) - 5
+    chunks = [payload[:12], payload[12:cut], payload[cut:]]
+    monkeypatch.setattr(reasoning, "get_client", make_mock_openai_stream(chunks))
+
+    ideas = reasoning.iter_new_ideas([{"content": "doc"}], [])
+    assert next(ideas) == first
+    assert list(ideas) == [second]
+
+
+def test_analyze_batch_maps_results_by_project(monkeypatch):
+    idea = {
+        "title": "Idea",
+        "problem": "A problem",
+        "proposal": "A proposal",
+        "business_value": "High",
+        "confidence_score": 0.8,
+    }
+    output_lines = [
+        {
+            "custom_id": "alpha",
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": json.dumps([idea])}}]},
+            },
+        },
+        {"custom_id": "beta", "response": {"status_code": 500, "body": {}}},
+    ]
+    uploads = []
+    statuses = iter(["in_progress", "completed"])
+
+    def files_create(file, purpose):
+        uploads.append((file, purpose))
+        return SimpleNamespace(id="file-in")
+
+    client = SimpleNamespace(
+        files=SimpleNamespace(
+            create=files_create,
+            content=lambda file_id: SimpleNamespace(
+                text="\n".join(json.dumps(line) for line in output_lines)
+            ),
+        ),
+        batches=SimpleNamespace(
+            create=lambda **kwargs: SimpleNamespace(id="batch-1", status="validating"),
+            retrieve=lambda batch_id: SimpleNamespace(
+                id=batch_id, status=next(statuses), output_file_id="file-out"
+            ),
+        ),
+    )
+    monkeypatch.setattr(reasoning, "get_client", lambda *args, **kwargs: client)
+
+    engine = reasoning.ReasoningEngine()
+    results = engine.analyze_batch(
+        [
+            {"id": "alpha", "documents": [{"content": "doc"}], "jira_issues": []},
+            {"id": "beta", "documents": [], "jira_issues": []},
+        ],
+        poll_interval=0,
+    )
+
+    assert results == {"alpha": [idea], "beta": []}
+    (name, payload), purpose = uploads[0]
+    assert purpose == "batch"
+    requests = [json.loads(line) for line in payload.decode("utf-8").splitlines()]
+    assert [r["custom_id"] for r in requests] == ["alpha", "beta"]
+    assert requests[0]["url"] == "/v1/chat/completions"
@@ -1,10 +1,7 @@
-import os
-import sys
 from unittest import mock
 
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from retrievers.roadmap_retriever import _extract_text, retrieve_roadmap_documents
 
 
@@ -53,7 +50,7 @@ def test_retrieve_roadmap_documents(monkeypatch):
     </html>
     """
 
-    def fake_get(url, timeout=30):
+    def fake_get(url, timeout=30, headers=None):
         response = mock.Mock()
         if url.endswith('/page1'):
             response.text = page1_html
@@ -62,13 +59,7 @@ def test_retrieve_roadmap_documents(monkeypatch):
         response.raise_for_status = mock.Mock()
         return response
 
-    monkeypatch.setattr('requests.get', fake_get)
-
-    def fake_bs(html, parser):
-        from bs4 import BeautifulSoup as RealBS
-        return RealBS(html, parser)
-
-    monkeypatch.setattr('retrievers.roadmap_retriever.BeautifulSoup', fake_bs)
+    monkeypatch.setattr('retrievers.roadmap_retriever._SESSION.get', fake_get)
 
     docs = retrieve_roadmap_documents('http://test.com')
     titles = [d['title'] for d in docs]
@@ -76,3 +67,145 @@ def test_retrieve_roadmap_documents(monkeypatch):
 
     assert titles == ['Main Page', 'Page1']
     assert urls == ['http://test.com', 'http://test.com/page1']
+
+
+def test_retrieve_roadmap_documents_fetches_each_level_concurrently(monkeypatch):
+    import threading
+
+    links = "".join(f"<a href='/p{i}'>P{i}</a>" for i in range(4))
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fake_get(url, timeout=30, headers=None):
+        response = mock.Mock()
+        if url == 'http://test.com':
+            response.text = f"<html><title>Main</title><body>{links}</body></html>"
+        else:
+            # all four subpages must be in flight at once to pass the barrier
+            barrier.wait()
+            response.text = f"<html><title>{url[-2:]}</title></html>"
+        return response
+
+    monkeypatch.setattr('retrievers.roadmap_retriever._SESSION.get', fake_get)
+
+    docs = retrieve_roadmap_documents('http://test.com', max_workers=4)
+
+    assert [d['title'] for d in docs] == ['Main', 'p0', 'p1', 'p2', 'p3']
+
+
+def test_retrieve_roadmap_documents_parses_each_page_once(monkeypatch):
+    from retrievers import roadmap_retriever
+
+    if roadmap_retriever.lxml_html is None:
+        pytest.skip("lxml not installed")
+    real_fromstring = roadmap_retriever.lxml_html.fromstring
+    parsed = []
+
+    def counting_fromstring(html):
+        parsed.append(html)
+        return real_fromstring(html)
+
+    def fake_get(url, timeout=30, headers=None):
+        response = mock.Mock()
+        response.text = (
+            "<html><head><title>Main</title><script>var a;</script></head>"
+            "<body><p>Main content</p></body></html>"
+        )
+        return response
+
+    monkeypatch.setattr('retrievers.roadmap_retriever._SESSION.get', fake_get)
+    monkeypatch.setattr(roadmap_retriever.lxml_html, 'fromstring', counting_fromstring)
+
+    docs = retrieve_roadmap_documents('http://test.com')
+
+    assert len(parsed) == 1
+    assert docs[0]['title'] == 'Main'
+    assert docs[0]['content'] == 'Main\nMain content'
+
+
+def test_parse_page_soup_fallback_matches_lxml():
+    from retrievers import roadmap_retriever
+
+    html = (
+        "<html><head><title> T </title><style>p {}</style></head><body>"
+        "<p>One <b>bold</b></p><!-- note --><a href='/x'>X</a>"
+        "<script>var y;</script>tail</body></html>"
+    )
+    expected = roadmap_retriever._parse_page_soup("u", html)
+
+    assert expected.title == "T"
+    assert expected.links == ["/x"]
+    assert expected.content == "T\nOne\nbold\nX\ntail"
+    assert roadmap_retriever._parse_page("u", html) == expected
+    assert roadmap_retriever._parse_page("u", "") == roadmap_retriever._parse_page_soup("u", "")
+
+
+def test_retrieve_roadmap_documents_fetches_shared_links_once(monkeypatch):
+    fetched = []
+    nav = "<a href='/a'>A</a><a href='/b'>B</a>"
+
+    def fake_get(url, timeout=30, headers=None):
+        fetched.append(url)
+        response = mock.Mock()
+        response.text = f"<html><title>{url}</title><body>{nav}</body></html>"
+        return response
+
+    monkeypatch.setattr('retrievers.roadmap_retriever._SESSION.get', fake_get)
+
+    retrieve_roadmap_documents('http://test.com')
+
+    assert sorted(fetched) == ['http://test.com', 'http://test.com/a', 'http://test.com/b']
+
+
+def test_retrieve_roadmap_documents_revalidates_cached_pages(tmp_path):
+    import requests_mock
+
+    cache_path = str(tmp_path / "roadmap.sqlite")
+    main_html = "<html><title>Main</title><body><a href='/p1'>P1</a>Main text</body></html>"
+    page_html = "<html><title>P1</title><body>P1 text</body></html>"
+
+    def respond(html, etag):
+        def callback(request, context):
+            if request.headers.get("If-None-Match") == etag:
+                context.status_code = 304
+                return ""
+            context.headers["ETag"] = etag
+            return html
+        return callback
+
+    with requests_mock.Mocker() as m:
+        m.get("http://test.com", text=respond(main_html, '"m1"'))
+        m.get("http://test.com/p1", text=respond(page_html, '"p1"'))
+
+        first = retrieve_roadmap_documents("http://test.com", cache_path=cache_path)
+        second = retrieve_roadmap_documents("http://test.com", cache_path=cache_path)
+
+    assert second == first
+    assert [d["title"] for d in second] == ["Main", "P1"]
+    validators = [r.headers.get("If-None-Match") for r in m.request_history]
+    assert validators == [None, None, '"m1"', '"p1"']
+
+
+def test_retrieve_roadmap_documents_refresh_bypasses_cache(tmp_path):
+    import requests_mock
+
+    cache_path = str(tmp_path / "roadmap.sqlite")
+
+    def callback(request, context):
+        if request.headers.get("If-None-Match") == '"v1"':
+            context.status_code = 304
+            return ""
+        context.headers["ETag"] = '"v1"'
+        return "<html><title>Main</title><body>Main text</body></html>"
+
+    with requests_mock.Mocker() as m:
+        m.get("http://test.com", text=callback)
+
+        retrieve_roadmap_documents("http://test.com", cache_path=cache_path)
+        docs = retrieve_roadmap_documents(
+            "http://test.com", cache_path=cache_path, refresh=True
+        )
+        retrieve_roadmap_documents("http://test.com", cache_path=cache_path)
+
+    assert [d["title"] for d in docs] == ["Main"]
+    validators = [r.headers.get("If-None-Match") for r in m.request_history]
+    assert validators == [None, None, '"v1"']
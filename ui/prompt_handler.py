@@ -5,15 +5,20 @@ for the agent orchestrator.
 """
 
 
+_DEFAULT_PROMPT = "Generate new product ideas based on documentation and JIRA tickets."
+
+
 class PromptHandler:
     """Collects and formats user prompts."""
 
-    def __init__(self) -> None:
-        pass
+    # stateless: no per-instance ``__dict__``
+    __slots__ = ()
+
+    PROMPT = _DEFAULT_PROMPT
 
     def get_prompt(self) -> str:
         """Return the user's prompt.
 
         For now this returns a static placeholder string.
         """
-        return "Generate new product ideas based on documentation and JIRA tickets."
+        return _DEFAULT_PROMPT